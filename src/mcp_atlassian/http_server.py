@@ -1,162 +1,185 @@
-from typing import Union
-import asyncio
-from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException
-from mcp.types import (
-    JSONRPCRequest, 
-    JSONRPCNotification, 
-    JSONRPCResponse, 
-    JSONRPCMessage,
-)
-from anyio import create_memory_object_stream
+from typing import Any, Awaitable, Callable, Dict, Literal, Optional, Tuple, Union, get_args
+from fastapi import FastAPI, HTTPException, Request, Response
+from mcp import types
 import logging
+import os
+import msgspec
 from .validation import validate_request
 from .mcp_methods import app as mcp_app
 
 logger = logging.getLogger(__name__)
 
-# Create two pairs of streams - one for each direction
-client_to_server_send, client_to_server_receive = create_memory_object_stream()
-server_to_client_send, server_to_client_receive = create_memory_object_stream()
-server_task = None
-
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """Manage the MCP server lifecycle"""
-    global server_task
-        
-    # Create a queue to track server status
-    status_queue = asyncio.Queue()
-    
-    async def server_runner():
-        try:
-            await status_queue.put("starting")
-                        
-            init_options = mcp_app.create_initialization_options(
-                notification_options=mcp_app.notification_options,
-                experimental_capabilities={}
-            )
-            
-            try:
-                await mcp_app.run(
-                    client_to_server_receive,  # Server reads from client
-                    server_to_client_send,     # Server writes to client
-                    init_options,
-                    raise_exceptions=True
-                )
-            except* Exception as eg:  # Use except* to catch ExceptionGroup
-                for e in eg.exceptions:
-                    logger.error("Server task error: %s: %s", type(e).__name__, str(e))
-                raise
-                
-            logger.info("MCP server run completed")
-        except Exception as e:
-            logger.error("Server error: %s", e)
-            await status_queue.put(f"error: {e}")
-    
-    server_task = asyncio.create_task(server_runner())
-    logger.debug("MCP server task created")
-    
-    # Wait for server to signal it's starting
-    try:
-        status = await asyncio.wait_for(status_queue.get(), timeout=5.0)
-        if status == "starting":
-            logger.info("MCP server starting")
-        else:
-            logger.warning("Unexpected server status: %s", status)
-    except asyncio.TimeoutError:
-        logger.error("Server startup timeout")
-    
-    yield  # Server runs during this yield
-    
-    logger.info("Shutting down MCP server...")
-    if server_task and not server_task.done():
-        server_task.cancel()
-        try:
-            await server_task
-            logger.info("MCP server shut down cleanly")
-        except asyncio.CancelledError:
-            logger.info("MCP server cancelled")
-        except Exception as e:
-            logger.error("Error shutting down MCP server: %s", e)
-
-api = FastAPI(title="MCP Atlassian HTTP Server", lifespan=lifespan)
-
-@api.post("/mcp")
-async def handle_mcp_request(
-    request: Union[JSONRPCRequest, JSONRPCNotification]
-) -> Union[JSONRPCResponse, None]:
+
+class JsonRpcRequest(msgspec.Struct):
+    """JSON-RPC request, or a notification when id is omitted."""
+
+    jsonrpc: Literal["2.0"]
+    method: str
+    id: Union[int, str, None] = None
+    params: Optional[Dict[str, Any]] = None
+
+
+class JsonRpcResponse(msgspec.Struct):
+    """JSON-RPC response sent back to the HTTP client."""
+
+    jsonrpc: Literal["2.0"]
+    id: Union[int, str]
+    result: Dict[str, Any]
+
+
+def _json_response(response: JsonRpcResponse) -> Response:
+    return Response(content=msgspec.json.encode(response), media_type="application/json")
+
+
+def _error_response(request_id: Union[int, str], code: int, message: str) -> Response:
+    return _json_response(
+        JsonRpcResponse(
+            jsonrpc="2.0",
+            id=request_id,
+            result={
+                "error": {
+                    "code": code,
+                    "message": message
+                }
+            }
+        )
+    )
+
+
+# Over stdio the MCP ServerSession answers initialize itself. HTTP requests
+# are dispatched without a session, so the result is built once up front.
+_init_options = mcp_app.create_initialization_options(
+    notification_options=mcp_app.notification_options,
+    experimental_capabilities={}
+)
+_initialize_result = types.ServerResult(
+    types.InitializeResult(
+        protocolVersion=types.LATEST_PROTOCOL_VERSION,
+        capabilities=_init_options.capabilities,
+        serverInfo=types.Implementation(
+            name=_init_options.server_name,
+            version=_init_options.server_version
+        )
+    )
+)
+
+
+async def _initialize(_: types.InitializeRequest) -> types.ServerResult:
+    return _initialize_result
+
+
+# Map each JSON-RPC method to its request type and the handler registered on
+# the MCP server by the decorators in mcp_methods.
+HANDLERS: Dict[str, Tuple[type, Callable[..., Awaitable[types.ServerResult]]]] = {
+    get_args(request_type.model_fields["method"].annotation)[0]: (request_type, handler)
+    for request_type, handler in mcp_app.request_handlers.items()
+}
+HANDLERS["initialize"] = (types.InitializeRequest, _initialize)
+
+api = FastAPI(title="MCP Atlassian HTTP Server")
+
+@api.post("/mcp", response_model=None)
+async def handle_mcp_request(http_request: Request) -> Optional[Response]:
     """
     Handle MCP requests over HTTP instead of stdio.
-    
+
     If the request has an id, it's a JSONRPCRequest and expects a response.
     If it doesn't have an id, it's a JSONRPCNotification and doesn't expect a response.
+
+    Requests are dispatched straight to the MCP server's handlers, so each
+    HTTP request is served concurrently in its own task.
     """
 
-    logger.debug("MCP request received: %s", request.model_dump_json()) 
-    
+    body = await http_request.body()
+    logger.debug("MCP request received: %s", body)
+
+    try:
+        request = msgspec.json.decode(body, type=JsonRpcRequest)
+    except msgspec.DecodeError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
     try:
         validate_request(request.method, request.params)
-        message = JSONRPCMessage(root=request)
 
         logger.debug("Received request - Method: %s, Params: %s", request.method, request.params)
-        if isinstance(request, JSONRPCRequest):
-            logger.debug("Request ID: %s", request.id)
-        else:
+        # If this was a notification (no id), there is nothing to send back
+        if request.id is None:
             logger.debug("Request type: Notification (no id)")
-        
-        await client_to_server_send.send(message)
-        logger.debug("Message sent to server")
-        # If this was a notification (no id), return None
-        if isinstance(request, JSONRPCNotification):
             return None
+        logger.debug("Request ID: %s", request.id)
 
-        try:
-            logger.debug("Waiting for response from server")
-            response = await asyncio.wait_for(
-                server_to_client_receive.receive(),
-                timeout=5.0  # 5 seconds
-            )
-            logger.debug("Response received from server")
-            
-            if isinstance(response, Exception):
-                logger.error("Got exception response: %s", response)
-                raise response
-            
-            if isinstance(response, JSONRPCMessage):
-                jsonrpc_response = response.root
-                if isinstance(jsonrpc_response, JSONRPCResponse):
-                    return JSONRPCResponse(
-                        jsonrpc=jsonrpc_response.jsonrpc,
-                        id=jsonrpc_response.id,
-                        result=jsonrpc_response.result
-                    )
-            
-            raise ValueError(f"Unexpected response type: {type(response)}")
-            
-        except asyncio.TimeoutError:
-            logger.error("Timeout waiting for response")
-            raise HTTPException(status_code=500, detail="No response received from MCP server")
+        entry = HANDLERS.get(request.method)
+        if entry is None:
+            logger.warning("No handler for method: %s", request.method)
+            return _error_response(request.id, types.METHOD_NOT_FOUND, "Method not found")
 
-    except Exception as e:
-        logger.error("Error handling request: %s", e)
-        if isinstance(request, JSONRPCRequest):
-            return JSONRPCResponse(
+        request_type, handler = entry
+        result = await handler(
+            request_type.model_validate({"method": request.method, "params": request.params})
+        )
+        logger.debug("Response produced for request %s", request.id)
+
+        return _json_response(
+            JsonRpcResponse(
                 jsonrpc="2.0",
                 id=request.id,
-                result={
-                    "error": {
-                        "code": -32603,  # Internal error
-                        "message": str(e)
-                    }
-                }
+                result=result.model_dump(by_alias=True, mode="json", exclude_none=True)
             )
+        )
+
+    except Exception as e:
+        logger.error("Error handling request: %s", e)
+        if request.id is not None:
+            return _error_response(request.id, types.INTERNAL_ERROR, str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
-def run_server(host: str = "0.0.0.0", port: int = 8000):
-    """Run the HTTP server."""
+def _log_config() -> Dict[str, Any]:
+    """Uvicorn's logging config plus the root logger setup done by main().
+
+    Uvicorn spawns its workers without running main(), so the app loggers are
+    configured here and applied by uvicorn in every worker process.
+    """
+    import copy
+    from uvicorn.config import LOGGING_CONFIG
+    log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+    config = copy.deepcopy(LOGGING_CONFIG)
+    config["formatters"]["app"] = {"format": logging.BASIC_FORMAT}
+    config["handlers"]["app"] = {
+        "formatter": "app",
+        "class": "logging.StreamHandler",
+        "stream": "ext://sys.stderr",
+    }
+    config["root"] = {
+        "handlers": ["app"],
+        "level": logging.getLevelName(getattr(logging, log_level, logging.INFO)),
+    }
+    return config
+
+def run_server(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
+    """
+    Run the HTTP server.
+
+    Args:
+        host: Interface to bind to
+        port: Port to listen on
+        workers: Number of worker processes. Defaults to the HTTP_WORKERS
+            environment variable, or 1 when that is unset or blank.
+    """
     import uvicorn
-    uvicorn.run(api, host=host, port=port)
+    if workers is None:
+        workers = int(os.getenv("HTTP_WORKERS", "").strip() or "1")
+    logger.info("Starting HTTP server on %s:%d with %d worker(s)", host, port, workers)
+    # Each worker is a separate process that imports the app itself, so uvicorn
+    # needs an import string rather than the app object. The default "auto"
+    # loop and http settings use uvloop and httptools whenever they are
+    # installed, falling back to asyncio and h11.
+    uvicorn.run(
+        "mcp_atlassian.http_server:api",
+        host=host,
+        port=port,
+        workers=workers,
+        log_config=_log_config(),
+    )
 
 if __name__ == "__main__":
     run_server()
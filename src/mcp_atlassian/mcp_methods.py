@@ -1,8 +1,12 @@
-import json
+import asyncio
 import logging
-from collections.abc import Sequence
-from typing import Any
+import os
+import re
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Optional
 
+import orjson
 from mcp.server import Server
 from mcp.types import (
     Resource, 
@@ -21,20 +25,97 @@ confluence_fetcher = ConfluenceFetcher()
 jira_fetcher = JiraFetcher()
 app = Server("mcp-atlassian")
 
+# Resource URIs: confluence://SPACE[/pages/TITLE] and jira://PROJECT[/issues/KEY]
+_CONFLUENCE_URI_RE = re.compile(r"confluence://([^/]*)(?:/pages/([^/]*)(?:/.*)?)?")
+_JIRA_URI_RE = re.compile(r"jira://([^/]*)(?:/issues/([^/]*)(?:/.*)?)?")
+
+
+# Spaces and projects change rarely, so resources/list reuses them for this many seconds
+RESOURCES_CACHE_TTL = float(os.getenv("RESOURCES_CACHE_TTL", "300"))
+# Keyed by listing name: (expiry, result) and the refresh task currently running
+_listings_cache: dict[str, tuple[float, Any]] = {}
+_listings_refreshing: dict[str, asyncio.Task] = {}
+
+
+async def _refresh_listing(key: str, fetch: Callable[[], Any]) -> Any:
+    """Fetch one listing in a worker thread and cache it on success."""
+    try:
+        result = await asyncio.to_thread(fetch)
+        _listings_cache[key] = (time.monotonic() + RESOURCES_CACHE_TTL, result)
+        return result
+    finally:
+        del _listings_refreshing[key]
+
+
+async def _get_listing(key: str, fetch: Callable[[], Any]) -> Any:
+    """Return one listing, reusing a result newer than the TTL.
+
+    Concurrent callers await the same refresh task, so a slow or failing
+    fetch runs once rather than once per caller. Failures are not cached.
+    """
+    if RESOURCES_CACHE_TTL <= 0:
+        return await asyncio.to_thread(fetch)
+
+    cached = _listings_cache.get(key)
+    if cached is not None and time.monotonic() < cached[0]:
+        logger.debug("Using cached %s", key)
+        return cached[1]
+
+    task = _listings_refreshing.get(key)
+    if task is None:
+        task = _listings_refreshing[key] = asyncio.create_task(_refresh_listing(key, fetch))
+    # Shield the shared task so one cancelled caller doesn't cancel it for the rest
+    return await asyncio.shield(task)
+
+
+async def _get_listings() -> list[Any]:
+    """Fetch Confluence spaces and Jira projects concurrently.
+
+    Each listing is cached separately, so a failure in one doesn't discard
+    the other. Failed fetches are returned as exceptions.
+    """
+    return await asyncio.gather(
+        _get_listing("Confluence spaces", confluence_fetcher.get_spaces),
+        _get_listing("Jira projects", jira_fetcher.jira.projects),
+        return_exceptions=True,
+    )
+
+
+def _limit(arguments: dict[str, Any], default: int = 10, maximum: int = 50) -> int:
+    """Read a tool's optional result limit, capped at the tool maximum."""
+    limit = arguments.get("limit", default)
+    # JSON numbers may arrive as floats, since the schema declares "number"
+    if type(limit) is not int:
+        limit = int(limit)
+    return min(limit, maximum)
+
+
+def _json_content(obj: Any) -> list[TextContent]:
+    """Wrap a tool result as indented JSON text content."""
+    text = orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    # The fields are always a literal type and a str built here, so skip validation
+    return [TextContent.model_construct(type="text", text=text)]
+
+
 @app.list_resources()
 async def list_resources() -> list[Resource]:
     """List available Confluence spaces and Jira projects as resources."""
     logger.debug("Listing resources...")
     resources = []
 
+    spaces_response, projects = await _get_listings()
+    if isinstance(spaces_response, BaseException):
+        raise spaces_response
+
     # Add Confluence spaces
-    spaces_response = confluence_fetcher.get_spaces()
     if isinstance(spaces_response, dict) and "results" in spaces_response:
         spaces = spaces_response["results"]
+        # Resources are built from trusted API data, so model_construct skips
+        # pydantic's per-item URL validation here and for Jira projects below.
         resources.extend(
             [
-                Resource(
-                    uri=AnyUrl(f"confluence://{space['key']}"),
+                Resource.model_construct(
+                    uri=f"confluence://{space['key']}",
                     name=f"Confluence Space: {space['name']}",
                     mimeType="text/plain",
                     description=space.get("description", {}).get("plain", {}).get("value", ""),
@@ -46,11 +127,12 @@ async def list_resources() -> list[Resource]:
 
     # Add Jira projects
     try:
-        projects = jira_fetcher.jira.projects()
+        if isinstance(projects, BaseException):
+            raise projects
         resources.extend(
             [
-                Resource(
-                    uri=AnyUrl(f"jira://{project['key']}"),
+                Resource.model_construct(
+                    uri=f"jira://{project['key']}",
                     name=f"Jira Project: {project['name']}",
                     mimeType="text/plain",
                     description=project.get("description", ""),
@@ -83,64 +165,41 @@ async def read_resource(uri: AnyUrl) -> str:
     uri_str = str(uri)
 
     # Handle Confluence resources
-    if uri_str.startswith("confluence://"):
-        parts = uri_str.replace("confluence://", "").split("/")
+    if match := _CONFLUENCE_URI_RE.fullmatch(uri_str):
+        space_key, title = match.groups()
 
         # Handle space listing
-        if len(parts) == 1:
-            space_key = parts[0]
-            documents = confluence_fetcher.get_space_pages(space_key)
-            content = []
-            for doc in documents:
-                content.append(f"# {doc.metadata['title']}\n\n{doc.page_content}\n---")
-            return "\n\n".join(content)
+        if title is None:
+            documents = await asyncio.to_thread(confluence_fetcher.get_space_pages, space_key)
+            return "\n\n".join(f"# {doc.metadata['title']}\n\n{doc.page_content}\n---" for doc in documents)
 
         # Handle specific page
-        elif len(parts) >= 3 and parts[1] == "pages":
-            space_key = parts[0]
-            title = parts[2]
-            doc = confluence_fetcher.get_page_by_title(space_key, title)
+        doc = await asyncio.to_thread(confluence_fetcher.get_page_by_title, space_key, title)
 
-            if not doc:
-                raise ValueError(f"Page not found: {title}")
+        if not doc:
+            raise ValueError(f"Page not found: {title}")
 
-            return doc.page_content
+        return doc.page_content
 
     # Handle Jira resources
-    elif uri_str.startswith("jira://"):
-        parts = uri_str.replace("jira://", "").split("/")
+    if match := _JIRA_URI_RE.fullmatch(uri_str):
+        project_key, issue_key = match.groups()
 
         # Handle project listing
-        if len(parts) == 1:
-            project_key = parts[0]
-            issues = jira_fetcher.get_project_issues(project_key)
-            content = []
-            for issue in issues:
-                content.append(f"# {issue.metadata['key']}: {issue.metadata['title']}\n\n{issue.page_content}\n---")
-            return "\n\n".join(content)
+        if issue_key is None:
+            issues = await asyncio.to_thread(jira_fetcher.get_project_issues, project_key)
+            return "\n\n".join(
+                f"# {issue.metadata['key']}: {issue.metadata['title']}\n\n{issue.page_content}\n---" for issue in issues
+            )
 
         # Handle specific issue
-        elif len(parts) >= 3 and parts[1] == "issues":
-            issue_key = parts[2]
-            issue = jira_fetcher.get_issue(issue_key)
-            return issue.page_content
+        issue = await asyncio.to_thread(jira_fetcher.get_issue, issue_key)
+        return issue.page_content
 
     raise ValueError(f"Invalid resource URI: {uri}")
 
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """List available Confluence and Jira tools."""
-    return [
-        Tool(
-            name="confluence_search",
-            description="Search Confluence content using CQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string", 
-                        "description": """CQL (Confluence Query Language) query string (e.g. 'type=page AND space=DEV').
+_CQL_QUERY_DESCRIPTION = """CQL (Confluence Query Language) query string (e.g. 'type=page AND space=DEV').
 
 Note, every query should have a "space" in it, otherwise it will likely
 return no results.
@@ -241,93 +300,227 @@ created >= "2008/12/31"
 Find all pages lastModified before the start of the year.
 lastModified < startOfYear()
 """
-                    },
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of results (1-50)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
-                },
-                "required": ["query"],
-            },
-        ),
-        Tool(
-            name="confluence_get_page",
-            description="Get content of a specific Confluence page by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "page_id": {"type": "string", "description": "Confluence page ID"},
-                    "include_metadata": {
-                        "type": "boolean",
-                        "description": "Whether to include page metadata",
-                        "default": True,
-                    },
-                },
-                "required": ["page_id"],
-            },
-        ),
-        Tool(
-            name="confluence_get_comments",
-            description="Get comments for a specific Confluence page",
-            inputSchema={
-                "type": "object",
-                "properties": {"page_id": {"type": "string", "description": "Confluence page ID"}},
-                "required": ["page_id"],
-            },
-        ),
-        Tool(
-            name="jira_get_issue",
-            description="Get details of a specific Jira issue",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "issue_key": {"type": "string", "description": "Jira issue key (e.g., 'PROJ-123')"},
-                    "expand": {"type": "string", "description": "Optional fields to expand", "default": None},
-                },
-                "required": ["issue_key"],
-            },
-        ),
-        Tool(
-            name="jira_search",
-            description="Search Jira issues using JQL",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "jql": {"type": "string", "description": "JQL query string"},
-                    "fields": {"type": "string", "description": "Comma-separated fields to return", "default": "*all"},
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of results (1-50)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
-                },
-                "required": ["jql"],
-            },
-        ),
-        Tool(
-            name="jira_get_project_issues",
-            description="Get all issues for a specific Jira project",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "project_key": {"type": "string", "description": "The project key"},
-                    "limit": {
-                        "type": "number",
-                        "description": "Maximum number of results (1-50)",
-                        "default": 10,
-                        "minimum": 1,
-                        "maximum": 50,
-                    },
-                },
-                "required": ["project_key"],
-            },
-        ),
+
+_LIMIT_PROPERTY = {
+    "type": "number",
+    "description": "Maximum number of results (1-50)",
+    "default": 10,
+    "minimum": 1,
+    "maximum": 50,
+}
+
+_CONFLUENCE_SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "description": _CQL_QUERY_DESCRIPTION},
+        "limit": _LIMIT_PROPERTY,
+    },
+    "required": ["query"],
+}
+
+_CONFLUENCE_GET_PAGE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "page_id": {"type": "string", "description": "Confluence page ID"},
+        "include_metadata": {
+            "type": "boolean",
+            "description": "Whether to include page metadata",
+            "default": True,
+        },
+    },
+    "required": ["page_id"],
+}
+
+_CONFLUENCE_GET_COMMENTS_SCHEMA = {
+    "type": "object",
+    "properties": {"page_id": {"type": "string", "description": "Confluence page ID"}},
+    "required": ["page_id"],
+}
+
+_JIRA_GET_ISSUE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "issue_key": {"type": "string", "description": "Jira issue key (e.g., 'PROJ-123')"},
+        "expand": {"type": "string", "description": "Optional fields to expand", "default": None},
+    },
+    "required": ["issue_key"],
+}
+
+_JIRA_SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "jql": {"type": "string", "description": "JQL query string"},
+        "fields": {"type": "string", "description": "Comma-separated fields to return", "default": "*all"},
+        "limit": _LIMIT_PROPERTY,
+    },
+    "required": ["jql"],
+}
+
+_JIRA_GET_PROJECT_ISSUES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "project_key": {"type": "string", "description": "The project key"},
+        "limit": _LIMIT_PROPERTY,
+    },
+    "required": ["project_key"],
+}
+
+# Tool metadata is static, so build it once rather than on every tools/list call.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="confluence_search",
+        description="Search Confluence content using CQL",
+        inputSchema=_CONFLUENCE_SEARCH_SCHEMA,
+    ),
+    Tool(
+        name="confluence_get_page",
+        description="Get content of a specific Confluence page by ID",
+        inputSchema=_CONFLUENCE_GET_PAGE_SCHEMA,
+    ),
+    Tool(
+        name="confluence_get_comments",
+        description="Get comments for a specific Confluence page",
+        inputSchema=_CONFLUENCE_GET_COMMENTS_SCHEMA,
+    ),
+    Tool(
+        name="jira_get_issue",
+        description="Get details of a specific Jira issue",
+        inputSchema=_JIRA_GET_ISSUE_SCHEMA,
+    ),
+    Tool(
+        name="jira_search",
+        description="Search Jira issues using JQL",
+        inputSchema=_JIRA_SEARCH_SCHEMA,
+    ),
+    Tool(
+        name="jira_get_project_issues",
+        description="Get all issues for a specific Jira project",
+        inputSchema=_JIRA_GET_PROJECT_ISSUES_SCHEMA,
+    ),
+]
+
+
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """List available Confluence and Jira tools."""
+    return _TOOLS
+
+
+async def _confluence_search(arguments: dict[str, Any]) -> list[TextContent]:
+    """Search Confluence content using CQL."""
+    limit = _limit(arguments)
+    logger.debug("Searching Confluence with query: %s (limit: %d)", arguments["query"], limit)
+    documents = await asyncio.to_thread(confluence_fetcher.search, arguments["query"], limit)
+    search_results = [
+        {
+            "page_id": doc.metadata["page_id"],
+            "title": doc.metadata["title"],
+            "space": doc.metadata["space"],
+            "url": doc.metadata["url"],
+            "last_modified": doc.metadata["last_modified"],
+            "type": doc.metadata["type"],
+            "excerpt": doc.page_content,
+        }
+        for doc in documents
+    ]
+    logger.debug("Found %d Confluence search results", len(search_results))
+    return _json_content(search_results)
+
+
+async def _confluence_get_page(arguments: dict[str, Any]) -> list[TextContent]:
+    """Get content of a specific Confluence page by ID."""
+    logger.debug("Fetching Confluence page: %s", arguments["page_id"])
+    doc = await asyncio.to_thread(confluence_fetcher.get_page_content, arguments["page_id"])
+    include_metadata = arguments.get("include_metadata", True)
+
+    if include_metadata:
+        result = {"content": doc.page_content, "metadata": doc.metadata}
+    else:
+        result = {"content": doc.page_content}
+
+    return _json_content(result)
+
+
+async def _confluence_get_comments(arguments: dict[str, Any]) -> list[TextContent]:
+    """Get comments for a specific Confluence page."""
+    logger.debug("Fetching comments for page: %s", arguments["page_id"])
+    comments = await asyncio.to_thread(confluence_fetcher.get_page_comments, arguments["page_id"])
+    formatted_comments = [
+        {
+            "author": comment.metadata["author_name"],
+            "created": comment.metadata["last_modified"],
+            "content": comment.page_content,
+        }
+        for comment in comments
     ]
+    logger.debug("Found %d comments", len(formatted_comments))
+    return _json_content(formatted_comments)
+
+
+async def _jira_get_issue(arguments: dict[str, Any]) -> list[TextContent]:
+    """Get details of a specific Jira issue."""
+    logger.debug("Fetching Jira issue: %s", arguments["issue_key"])
+    doc = await asyncio.to_thread(
+        jira_fetcher.get_issue, arguments["issue_key"], expand=arguments.get("expand")
+    )
+    result = {"content": doc.page_content, "metadata": doc.metadata}
+    return _json_content(result)
+
+
+async def _jira_search(arguments: dict[str, Any]) -> list[TextContent]:
+    """Search Jira issues using JQL."""
+    limit = _limit(arguments)
+    logger.debug("Searching Jira with JQL: %s (limit: %d)", arguments["jql"], limit)
+    documents = await asyncio.to_thread(
+        jira_fetcher.search_issues, arguments["jql"], fields=arguments.get("fields", "*all"), limit=limit
+    )
+    search_results = [
+        {
+            "key": doc.metadata["key"],
+            "title": doc.metadata["title"],
+            "type": doc.metadata["type"],
+            "status": doc.metadata["status"],
+            "created_date": doc.metadata["created_date"],
+            "priority": doc.metadata["priority"],
+            "link": doc.metadata["link"],
+            "excerpt": content[:500] + "..." if len(content := doc.page_content) > 500 else content,
+        }
+        for doc in documents
+    ]
+    logger.debug("Found %d Jira search results", len(search_results))
+    return _json_content(search_results)
+
+
+async def _jira_get_project_issues(arguments: dict[str, Any]) -> list[TextContent]:
+    """Get all issues for a specific Jira project."""
+    limit = _limit(arguments)
+    logger.debug("Fetching issues for project: %s (limit: %d)", arguments["project_key"], limit)
+    documents = await asyncio.to_thread(
+        jira_fetcher.get_project_issues, arguments["project_key"], limit=limit
+    )
+    project_issues = [
+        {
+            "key": doc.metadata["key"],
+            "title": doc.metadata["title"],
+            "type": doc.metadata["type"],
+            "status": doc.metadata["status"],
+            "created_date": doc.metadata["created_date"],
+            "link": doc.metadata["link"],
+        }
+        for doc in documents
+    ]
+    logger.debug("Found %d project issues", len(project_issues))
+    return _json_content(project_issues)
+
+
+_TOOL_HANDLERS: dict[str, Callable[[dict[str, Any]], Awaitable[list[TextContent]]]] = {
+    "confluence_search": _confluence_search,
+    "confluence_get_page": _confluence_get_page,
+    "confluence_get_comments": _confluence_get_comments,
+    "jira_get_issue": _jira_get_issue,
+    "jira_search": _jira_search,
+    "jira_get_project_issues": _jira_get_project_issues,
+}
 
 
 @app.call_tool()
@@ -335,99 +528,11 @@ async def call_tool(name: str, arguments: Any) -> Sequence[TextContent]:
     """Handle tool calls for Confluence and Jira operations."""
     try:
         logger.debug("Executing tool '%s' with arguments: %s", name, arguments)
-        
-        if name == "confluence_search":
-            limit = min(int(arguments.get("limit", 10)), 50)
-            logger.debug("Searching Confluence with query: %s (limit: %d)", arguments["query"], limit)
-            documents = confluence_fetcher.search(arguments["query"], limit)
-            search_results = [
-                {
-                    "page_id": doc.metadata["page_id"],
-                    "title": doc.metadata["title"],
-                    "space": doc.metadata["space"],
-                    "url": doc.metadata["url"],
-                    "last_modified": doc.metadata["last_modified"],
-                    "type": doc.metadata["type"],
-                    "excerpt": doc.page_content,
-                }
-                for doc in documents
-            ]
-            logger.debug("Found %d Confluence search results", len(search_results))
-            return [TextContent(type="text", text=json.dumps(search_results, indent=2))]
-
-        elif name == "confluence_get_page":
-            logger.debug("Fetching Confluence page: %s", arguments["page_id"])
-            doc = confluence_fetcher.get_page_content(arguments["page_id"])
-            include_metadata = arguments.get("include_metadata", True)
-
-            if include_metadata:
-                result = {"content": doc.page_content, "metadata": doc.metadata}
-            else:
-                result = {"content": doc.page_content}
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "confluence_get_comments":
-            logger.debug("Fetching comments for page: %s", arguments["page_id"])
-            comments = confluence_fetcher.get_page_comments(arguments["page_id"])
-            formatted_comments = [
-                {
-                    "author": comment.metadata["author_name"],
-                    "created": comment.metadata["last_modified"],
-                    "content": comment.page_content,
-                }
-                for comment in comments
-            ]
-            logger.debug("Found %d comments", len(formatted_comments))
-            return [TextContent(type="text", text=json.dumps(formatted_comments, indent=2))]
-
-        elif name == "jira_get_issue":
-            logger.debug("Fetching Jira issue: %s", arguments["issue_key"])
-            doc = jira_fetcher.get_issue(arguments["issue_key"], expand=arguments.get("expand"))
-            result = {"content": doc.page_content, "metadata": doc.metadata}
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "jira_search":
-            limit = min(int(arguments.get("limit", 10)), 50)
-            logger.debug("Searching Jira with JQL: %s (limit: %d)", arguments["jql"], limit)
-            documents = jira_fetcher.search_issues(
-                arguments["jql"], fields=arguments.get("fields", "*all"), limit=limit
-            )
-            search_results = [
-                {
-                    "key": doc.metadata["key"],
-                    "title": doc.metadata["title"],
-                    "type": doc.metadata["type"],
-                    "status": doc.metadata["status"],
-                    "created_date": doc.metadata["created_date"],
-                    "priority": doc.metadata["priority"],
-                    "link": doc.metadata["link"],
-                    "excerpt": doc.page_content[:500] + "..." if len(doc.page_content) > 500 else doc.page_content,
-                }
-                for doc in documents
-            ]
-            logger.debug("Found %d Jira search results", len(search_results))
-            return [TextContent(type="text", text=json.dumps(search_results, indent=2))]
-
-        elif name == "jira_get_project_issues":
-            limit = min(int(arguments.get("limit", 10)), 50)
-            logger.debug("Fetching issues for project: %s (limit: %d)", arguments["project_key"], limit)
-            documents = jira_fetcher.get_project_issues(arguments["project_key"], limit=limit)
-            project_issues = [
-                {
-                    "key": doc.metadata["key"],
-                    "title": doc.metadata["title"],
-                    "type": doc.metadata["type"],
-                    "status": doc.metadata["status"],
-                    "created_date": doc.metadata["created_date"],
-                    "link": doc.metadata["link"],
-                }
-                for doc in documents
-            ]
-            logger.debug("Found %d project issues", len(project_issues))
-            return [TextContent(type="text", text=json.dumps(project_issues, indent=2))]
 
-        raise ValueError(f"Unknown tool: {name}")
+        handler = _TOOL_HANDLERS.get(name)
+        if handler is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return await handler(arguments)
 
     except Exception as e:
         if hasattr(e, 'response'):
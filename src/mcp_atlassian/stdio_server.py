@@ -19,7 +19,12 @@ async def run_stdio_server():
 
 def main():
     """Main entry point for stdio server."""
-    asyncio.run(run_stdio_server())
+    try:
+        import uvloop
+    except ImportError:  # uvloop is not available on Windows
+        asyncio.run(run_stdio_server())
+    else:
+        uvloop.run(run_stdio_server())
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,28 @@
+"""
+Validation of MCP request params received over HTTP.
+
+Params are plain JSON-decoded values (see http_server), so type checks use
+exact ``type(x) is ...`` comparisons rather than isinstance().
+"""
 from typing import Any, Dict
 from fastapi import HTTPException
 
+# Required fields per method, mapped to the message reported when missing.
+# Built once at import rather than on every validated request.
+_INITIALIZE_REQUIRED_FIELDS = {
+    "protocolVersion": "Protocol version is required for version negotiation",
+    "capabilities": "Client capabilities are required for capability negotiation",
+    "clientInfo": "Client implementation information is required"
+}
+
+_COMPLETE_REQUIRED_FIELDS = {
+    "ref": "Reference to resource or prompt is required",
+    "argument": "Completion argument is required"
+}
+
+_INITIALIZE_REQUIRED = frozenset(_INITIALIZE_REQUIRED_FIELDS)
+_COMPLETE_REQUIRED = frozenset(_COMPLETE_REQUIRED_FIELDS)
+
 
 def validate_initialize_params(params: Dict[str, Any]) -> None:
     """Validate initialize request params."""
@@ -10,13 +32,11 @@ def validate_initialize_params(params: Dict[str, Any]) -> None:
             detail="Initialize request requires params with protocolVersion, capabilities, and clientInfo"
         )
 
-    required_fields = {
-        "protocolVersion": "Protocol version is required for version negotiation",
-        "capabilities": "Client capabilities are required for capability negotiation",
-        "clientInfo": "Client implementation information is required"
-    }
-    missing_fields = {k: v for k, v in required_fields.items() if k not in params}
-    if missing_fields:
+    # Set difference against the dict runs in C; the message dict is only
+    # built on the error path.
+    missing = _INITIALIZE_REQUIRED.difference(params)
+    if missing:
+        missing_fields = {k: v for k, v in _INITIALIZE_REQUIRED_FIELDS.items() if k in missing}
         raise HTTPException(
             status_code=400,
             detail={
@@ -25,20 +45,24 @@ def validate_initialize_params(params: Dict[str, Any]) -> None:
             }
         )
 
-    if not isinstance(params["protocolVersion"], str):
+    # All three are known to be present, so read each one exactly once
+    protocol_version = params["protocolVersion"]
+    capabilities = params["capabilities"]
+    client_info = params["clientInfo"]
+
+    if type(protocol_version) is not str:
         raise HTTPException(
             status_code=400,
             detail="protocolVersion must be a string"
         )
 
-    if not isinstance(params["capabilities"], dict):
+    if type(capabilities) is not dict:
         raise HTTPException(
             status_code=400,
             detail="capabilities must be an object"
         )
 
-    client_info = params["clientInfo"]
-    if not isinstance(client_info, dict):
+    if type(client_info) is not dict:
         raise HTTPException(
             status_code=400,
             detail="clientInfo must be an object"
@@ -49,22 +73,6 @@ def validate_initialize_params(params: Dict[str, Any]) -> None:
             detail="clientInfo must include name and version"
         )
 
-def validate_read_resource_params(params: Dict[str, Any]) -> None:
-    """Validate resources/read request params."""
-    if params is None or "uri" not in params:
-        raise HTTPException(
-            status_code=400,
-            detail="resources/read request requires uri parameter"
-        )
-
-def validate_call_tool_params(params: Dict[str, Any]) -> None:
-    """Validate tools/call request params."""
-    if params is None or "name" not in params:
-        raise HTTPException(
-            status_code=400,
-            detail="tools/call request requires name parameter"
-        )
-
 def validate_complete_params(params: Dict[str, Any]) -> None:
     """Validate completion/complete request params."""
     if params is None:
@@ -72,13 +80,10 @@ def validate_complete_params(params: Dict[str, Any]) -> None:
             status_code=400,
             detail="completion/complete request requires ref and argument parameters"
         )
-    
-    required_fields = {
-        "ref": "Reference to resource or prompt is required",
-        "argument": "Completion argument is required"
-    }
-    missing_fields = {k: v for k, v in required_fields.items() if k not in params}
-    if missing_fields:
+
+    missing = _COMPLETE_REQUIRED.difference(params)
+    if missing:
+        missing_fields = {k: v for k, v in _COMPLETE_REQUIRED_FIELDS.items() if k in missing}
         raise HTTPException(
             status_code=400,
             detail={
@@ -87,14 +92,25 @@ def validate_complete_params(params: Dict[str, Any]) -> None:
             }
         )
 
-VALIDATORS = {
-    "initialize": validate_initialize_params,
-    "resources/read": validate_read_resource_params,
-    "tools/call": validate_call_tool_params,
-    "completion/complete": validate_complete_params,
-}
-
 def validate_request(method: str, params: Dict[str, Any]) -> None:
     """Validate request params based on method."""
-    if validator := VALIDATORS.get(method):
-        validator(params) 
+    # Arms are ordered by expected frequency, tool calls first. The single-key
+    # checks are inlined to save a call per request. Methods without an arm
+    # (notifications, ping, the list methods) fall through unchecked.
+    match method:
+        case "tools/call":
+            if params is None or "name" not in params:
+                raise HTTPException(
+                    status_code=400,
+                    detail="tools/call request requires name parameter"
+                )
+        case "resources/read":
+            if params is None or "uri" not in params:
+                raise HTTPException(
+                    status_code=400,
+                    detail="resources/read request requires uri parameter"
+                )
+        case "initialize":
+            validate_initialize_params(params)
+        case "completion/complete":
+            validate_complete_params(params)